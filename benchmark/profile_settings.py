@@ -1,9 +1,23 @@
 #!/usr/bin/env python3
-"""Profile msgspec-ext to find bottlenecks."""
+"""Profile msgspec-ext to find bottlenecks.
+
+Uses pyinstrument, a sampling profiler: unlike cProfile it adds no per-call
+hooks, so time spent in C (e.g. msgspec.convert) is not distorted relative to
+instrumented Python calls.
+
+Usage:
+    uv run --with pyinstrument python profile_settings.py
+"""
 
-import cProfile
 import os
-import pstats
+import sys
+
+try:
+    import pyinstrument
+except ImportError:
+    sys.exit(
+        "pyinstrument is required: uv run --with pyinstrument python profile_settings.py"
+    )
 
 from msgspec_ext import BaseSettings, SettingsConfigDict
 
@@ -44,23 +58,14 @@ def profile_run():
 
 
 if __name__ == "__main__":
-    profiler = cProfile.Profile()
-    profiler.enable()
+    profiler = pyinstrument.Profiler()
+    profiler.start()
     profile_run()
-    profiler.disable()
-
-    stats = pstats.Stats(profiler)
-    stats.strip_dirs()
-    stats.sort_stats("cumulative")
-
-    print("\n" + "=" * 80)
-    print("TOP 20 FUNCTIONS BY CUMULATIVE TIME")
-    print("=" * 80)
-    stats.print_stats(20)
+    profiler.stop()
 
     print("\n" + "=" * 80)
-    print("SETTINGS-RELATED FUNCTIONS")
+    print("SAMPLED CALL TREE")
     print("=" * 80)
-    stats.print_stats("msgspec_ext")
+    print(profiler.output_text(unicode=True, color=True))
 
     os.unlink(".env.profile")
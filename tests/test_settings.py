@@ -3,6 +3,7 @@
 import os
 import tempfile
 from pathlib import Path
+from typing import Optional, Union
 
 import pytest
 
@@ -392,3 +393,327 @@ def test_explicit_override_env():
         assert settings.port == 7000  # explicit overrides env
     finally:
         os.environ.pop("PORT", None)
+
+
+def test_settings_subclass_gets_own_builder():
+    """Test that a settings subclass does not reuse its parent's env builder."""
+    os.environ["NAME"] = "unprefixed"
+    os.environ["APP_NAME"] = "prefixed"
+
+    try:
+
+        class AppSettings(BaseSettings):
+            name: str
+
+        class PrefixedSettings(AppSettings):
+            model_config = SettingsConfigDict(env_prefix="APP_")
+            name: str
+
+        # Build the parent first so its builder exists before the subclass's
+        assert AppSettings().name == "unprefixed"
+        assert PrefixedSettings().name == "prefixed"
+    finally:
+        os.environ.pop("NAME", None)
+        os.environ.pop("APP_NAME", None)
+
+
+def test_str_field_keeps_json_like_value():
+    """Test that str fields are not JSON-decoded."""
+    os.environ["PATTERN"] = "[a-z]+"
+
+    try:
+
+        class PatternSettings(BaseSettings):
+            pattern: str
+
+        settings = PatternSettings()
+        assert settings.pattern == "[a-z]+"
+    finally:
+        os.environ.pop("PATTERN", None)
+
+
+def test_explicit_values_are_validated_by_default():
+    """Test that explicit keyword arguments are validated and coerced."""
+
+    class AppSettings(BaseSettings):
+        port: int = 8000
+
+    assert AppSettings(port="9000").port == 9000
+
+    with pytest.raises(ValueError):
+        AppSettings(port="not-a-number")
+
+
+def test_explicit_values_without_validation():
+    """Test validate_kwargs=False passes trusted kwargs straight through."""
+
+    class AppSettings(BaseSettings):
+        model_config = SettingsConfigDict(validate_kwargs=False)
+
+        name: str
+        port: int = 8000
+
+    settings = AppSettings(name="trusted", port=9000)
+    assert settings.name == "trusted"
+    assert settings.port == 9000
+
+    # No coercion on the trusted path
+    assert AppSettings(name="trusted", port="9000").port == "9000"
+
+    with pytest.raises(TypeError):
+        AppSettings(name="trusted", unknown="value")
+
+
+def test_settings_with_missing_env_file(tmp_path, monkeypatch):
+    """Test that a missing .env file is stat'ed only once across instantiations."""
+    missing_path = str(tmp_path / "missing.env")
+    exists_calls = []
+    real_exists = os.path.exists
+
+    def counting_exists(path):
+        exists_calls.append(path)
+        return real_exists(path)
+
+    monkeypatch.setattr(os.path, "exists", counting_exists)
+
+    class AppSettings(BaseSettings):
+        model_config = SettingsConfigDict(env_file=missing_path)
+
+        name: str = "default"
+
+    assert AppSettings().name == "default"
+    assert AppSettings().name == "default"
+    assert exists_calls.count(os.path.abspath(missing_path)) == 1
+
+
+def test_cache_instances_reuses_instance_while_env_unchanged():
+    """Test cache_instances=True returns the same instance until env changes."""
+    os.environ["PORT"] = "9000"
+
+    try:
+
+        class AppSettings(BaseSettings):
+            model_config = SettingsConfigDict(cache_instances=True)
+
+            port: int = 8000
+
+        settings1 = AppSettings()
+        settings2 = AppSettings()
+        assert settings1 is settings2
+
+        os.environ["PORT"] = "9001"
+        settings3 = AppSettings()
+        assert settings3 is not settings1
+        assert settings3.port == 9001
+    finally:
+        os.environ.pop("PORT", None)
+
+
+def test_cache_instances_with_explicit_values():
+    """Test cache_instances=True caches by kwargs, only for plain scalar values."""
+
+    class AppSettings(BaseSettings):
+        model_config = SettingsConfigDict(cache_instances=True)
+
+        port: int = 8000
+        hosts: list[str] | None = None
+
+    assert AppSettings(port=9000) is AppSettings(port=9000)
+    assert AppSettings(port=9000) is not AppSettings(port=9001)
+
+    # Only exact str/int/float/bool/None values are cached; others are built fresh
+    settings = AppSettings(hosts=["localhost"])
+    assert settings.hosts == ["localhost"]
+    assert AppSettings(hosts=["localhost"]) is not settings
+
+
+def test_cache_instances_never_skips_nested_validation():
+    """Test that non-scalar kwargs are always validated, not served from cache."""
+
+    class AppSettings(BaseSettings):
+        model_config = SettingsConfigDict(cache_instances=True)
+
+        ports: tuple[int, ...] = ()
+
+    assert AppSettings(ports=(1,)).ports == (1,)
+
+    # (True,) == (1,), but it must still be validated (and rejected)
+    with pytest.raises(ValueError):
+        AppSettings(ports=(True,))
+
+
+def test_cache_instances_is_bounded():
+    """Test that the kwargs cache is an LRU and env caching keeps one entry."""
+    from msgspec_ext.settings import _KWARGS_CACHE_MAXSIZE
+
+    class AppSettings(BaseSettings):
+        model_config = SettingsConfigDict(cache_instances=True)
+
+        port: int = 8000
+
+    first = AppSettings(port=0)
+    for port in range(1, _KWARGS_CACHE_MAXSIZE * 2):
+        AppSettings(port=port)
+
+    assert len(BaseSettings._instance_cache[AppSettings]) == _KWARGS_CACHE_MAXSIZE
+    assert AppSettings(port=0) is not first  # evicted
+
+    os.environ["PORT"] = "9000"
+    try:
+        settings1 = AppSettings()
+        os.environ["PORT"] = "9001"
+        AppSettings()
+        os.environ["PORT"] = "9000"
+        # Only the last env fingerprint is kept
+        assert AppSettings() is not settings1
+        assert AppSettings().port == 9000
+    finally:
+        os.environ.pop("PORT", None)
+
+
+def test_instances_not_cached_by_default():
+    """Test that each instantiation returns a new instance by default."""
+
+    class AppSettings(BaseSettings):
+        port: int = 8000
+
+    assert AppSettings() is not AppSettings()
+
+
+def test_settings_config_dict_is_frozen_and_hashable():
+    """Test that SettingsConfigDict is immutable and usable as a dict key."""
+    config = SettingsConfigDict(env_prefix="APP_")
+
+    with pytest.raises(AttributeError):
+        config.env_prefix = "OTHER_"
+
+    assert hash(config) == hash(SettingsConfigDict(env_prefix="APP_"))
+    assert {config: "app"}[SettingsConfigDict(env_prefix="APP_")] == "app"
+
+
+def test_env_prefix_with_quote_characters():
+    """Test that env names are embedded safely in the generated builder."""
+    os.environ["A'B\"_PORT"] = "9000"
+
+    try:
+
+        class AppSettings(BaseSettings):
+            model_config = SettingsConfigDict(env_prefix="A'B\"_")
+
+            port: int = 8000
+
+        assert AppSettings().port == 9000
+    finally:
+        os.environ.pop("A'B\"_PORT", None)
+
+
+def test_optional_bool_conversion_variants():
+    """Test that Optional/PEP 604 unions unwrap to their base type."""
+    os.environ["PEP604_FLAG"] = "yes"
+    os.environ["OPTIONAL_FLAG"] = "y"
+
+    try:
+
+        class FlagSettings(BaseSettings):
+            pep604_flag: bool | None = None
+            optional_flag: Optional[bool] = None  # noqa: UP045
+
+        settings = FlagSettings()
+        assert settings.pep604_flag is True
+        assert settings.optional_flag is True
+    finally:
+        os.environ.pop("PEP604_FLAG", None)
+        os.environ.pop("OPTIONAL_FLAG", None)
+
+
+def test_numeric_env_parsing():
+    """Test int/float env parsing follows Python's int()/float()."""
+    accepted = [
+        ("INT_VAL", " 42 ", 42),
+        ("INT_VAL", "+5", 5),
+        ("INT_VAL", "1_000", 1000),
+        ("FLOAT_VAL", " 1.5", 1.5),
+        ("FLOAT_VAL", "1e3", 1000.0),
+    ]
+    for env_name, env_value, expected in accepted:
+        os.environ[env_name] = env_value
+
+        try:
+
+            class NumberSettings(BaseSettings):
+                int_val: int = 0
+                float_val: float = 0.0
+
+            settings = NumberSettings()
+            assert getattr(settings, env_name.lower()) == expected, (
+                f"Failed for {env_name}='{env_value}'"
+            )
+        finally:
+            os.environ.pop(env_name, None)
+
+
+def test_numeric_env_parsing_rejects_non_integers():
+    """Test that float-like strings and "null" are rejected for int fields."""
+    for env_value in ("1.0", "1e3", "null"):
+        os.environ["INT_VAL"] = env_value
+
+        try:
+
+            class NumberSettings(BaseSettings):
+                int_val: int | None = None
+
+            with pytest.raises(ValueError):
+                NumberSettings()
+        finally:
+            os.environ.pop("INT_VAL", None)
+
+
+def test_multi_type_union_decodes_json():
+    """Test that unions of several types still get JSON decoding."""
+    os.environ["PORTS"] = "[1,2]"
+
+    try:
+
+        class UnionSettings(BaseSettings):
+            ports: Union[int, list[int]]
+
+        assert UnionSettings().ports == [1, 2]
+
+        os.environ["PORTS"] = "8080"
+        assert UnionSettings().ports == 8080
+    finally:
+        os.environ.pop("PORTS", None)
+
+
+def test_multi_type_union_converts_like_first_member():
+    """Test that non-JSON values in a union convert like its first member."""
+    os.environ["Z"] = "8080"
+    os.environ["W"] = "8080"
+
+    try:
+
+        class UnionSettings(BaseSettings):
+            z: Union[int, str] = 0
+            w: int | str | None = None
+
+        settings = UnionSettings()
+        assert settings.z == 8080
+        assert settings.w == 8080
+    finally:
+        os.environ.pop("Z", None)
+        os.environ.pop("W", None)
+
+
+def test_generated_builder_source_in_tracebacks():
+    """Test that tracebacks through the generated builder show its source."""
+    import traceback
+
+    class AppSettings(BaseSettings):
+        port: int
+
+    with pytest.raises(ValueError) as exc_info:
+        AppSettings()
+
+    formatted = "".join(traceback.format_exception(exc_info.value))
+    assert "<msgspec_ext fast_build" in formatted
+    assert 'raise ValueError(f"Validation error: {e}") from e' in formatted